@@ -5,22 +5,27 @@ Stock Intelligence Multi-Agent System - CLI Entry Point
 Professional CLI interface using Rich library for beautiful terminal output.
 """
 
+import asyncio
+import atexit
+import queue
+import re
 import sys
-import uuid
 import os
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
+from rich.text import Text
 from rich import box
-from langchain_core.messages import HumanMessage
-from langgraph.types import Command
 import logging
 
-from src.graph import create_graph, create_thread_config
-from src.state import AgentState
-from src.config import Config
+# Heavy framework imports (langgraph/langchain/pydantic chains) are deferred
+# into the functions that need them so the banner and prompts appear
+# instantly on startup - see _get_graph, run_analysis and handle_interrupt.
 
 # Enable UTF-8 mode on Windows to handle Unicode characters from LLM responses
 if sys.platform == "win32":
@@ -28,31 +33,86 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
     sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('stock_intelligence.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Setup logging - records are enqueued on the hot path and written by a
+# background QueueListener thread, so disk/stdout I/O never blocks the
+# streaming loop. delay=True defers opening the log file until first write.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('stock_intelligence.log', encoding='utf-8', delay=True)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue side only carries the raw message; the listener's handlers
+# apply the real format (avoids double-formatting each record)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
-# Rich console - force_terminal=True uses ANSI sequences instead of legacy Windows API
-console = Console(force_terminal=True)
+# Rich console - force_terminal=True uses ANSI sequences instead of legacy
+# Windows API; highlight=False skips the regex auto-highlighter, which would
+# otherwise scan every streamed token chunk
+console = Console(force_terminal=True, highlight=False)
+
+# Per-agent display styles - module-level so the streaming hot path doesn't
+# rebuild these dicts on every printed update/token block
+_AGENT_COLORS = {
+    "supervisor": "yellow",
+    "researcher": "green",
+    "analyst": "blue",
+    "system": "magenta"
+}
+
+# Agent icons using ASCII-safe symbols
+_AGENT_ICONS = {
+    "supervisor": "[S]",
+    "researcher": "[R]",
+    "analyst": "[A]",
+    "system": "[*]"
+}
+
+# Syntactic ticker check - rejects obvious typos before we pay for graph
+# construction and an LLM round-trip (e.g. "BRK.B", "RDS-A" are valid)
+_TICKER_RE = re.compile(r"^[A-Z][A-Z0-9.\-]{0,9}$")
+
+# Nodes whose updates get rendered in each streaming loop
+_RENDER_NODES = frozenset({"supervisor", "researcher", "analyst"})
+_RESUME_NODES = frozenset({"supervisor", "human_review"})
+
+# Static chrome for the human-review flow, built once instead of per interrupt
+_SEP80 = "=" * 80
+_DECISION_HELP = Text.from_markup(
+    "\n[bold]Options:[/bold]\n"
+    "  • Type [green]APPROVE[/green] to accept the recommendation\n"
+    "  • Type [red]REJECT[/red] to decline the recommendation\n"
+    "  • Or provide custom feedback\n"
+)
 
 
-def print_banner():
-    """Display application banner."""
-    banner = """
+# Banner renderable built once at import - Markdown parsing is not free and
+# the banner never changes
+_BANNER = Panel(
+    Markdown("""
 # Stock Intelligence Multi-Agent System
 
 **Powered by LangGraph | OpenRouter | yfinance**
 
 A professional multi-agent system for intelligent stock analysis with human-in-the-loop decision making.
-"""
-    console.print(Panel(Markdown(banner), box=box.DOUBLE, border_style="cyan", title="[bold cyan]STOCK INTELLIGENCE[/bold cyan]"))
+"""),
+    box=box.DOUBLE,
+    border_style="cyan",
+    title="[bold cyan]STOCK INTELLIGENCE[/bold cyan]"
+)
+
+
+def print_banner():
+    """Display application banner."""
+    console.print(_BANNER)
 
 
 def print_agent_message(agent: str, message: str):
@@ -63,25 +123,31 @@ def print_agent_message(agent: str, message: str):
         agent: Agent name (supervisor, researcher, analyst)
         message: Message content
     """
-    colors = {
-        "supervisor": "yellow",
-        "researcher": "green",
-        "analyst": "blue",
-        "system": "magenta"
-    }
-    color = colors.get(agent.lower(), "white")
-
-    # Agent icons using ASCII-safe symbols
-    icons = {
-        "supervisor": "[S]",
-        "researcher": "[R]",
-        "analyst": "[A]",
-        "system": "[*]"
-    }
-    icon = icons.get(agent.lower(), ">")
+    key = agent.lower()
+    color = _AGENT_COLORS.get(key, "white")
+    icon = _AGENT_ICONS.get(key, ">")
 
     console.print(f"\n[bold {color}]{icon} {agent.upper()}[/bold {color}]")
-    console.print(Panel(message, border_style=color, box=box.ROUNDED))
+    # Text() skips markup parsing - LLM output with stray [brackets] would
+    # otherwise be regex-scanned (and possibly mis-rendered) by Rich
+    console.print(Panel(Text(message), border_style=color, box=box.ROUNDED))
+
+
+def _agent_header(agent: str) -> Text:
+    """
+    Build the colored agent header as a renderable.
+
+    Args:
+        agent: Agent name (supervisor, researcher, analyst)
+
+    Returns:
+        Styled Text header for the agent's output block
+    """
+    key = agent.lower()
+    color = _AGENT_COLORS.get(key, "white")
+    icon = _AGENT_ICONS.get(key, ">")
+
+    return Text.from_markup(f"\n[bold {color}]{icon} {agent.upper()}[/bold {color}]")
 
 
 def get_analysis_mode() -> tuple:
@@ -107,6 +173,10 @@ def get_analysis_mode() -> tuple:
             console.print("[red]Error: Ticker cannot be empty[/red]")
             sys.exit(1)
 
+        if not _TICKER_RE.match(ticker):
+            console.print(f"[red]Error: '{ticker}' is not a valid ticker format[/red]")
+            sys.exit(1)
+
         return ("single", ticker, None, None)
 
     else:
@@ -118,11 +188,19 @@ def get_analysis_mode() -> tuple:
             console.print("[red]Error: First ticker cannot be empty[/red]")
             sys.exit(1)
 
+        if not _TICKER_RE.match(ticker_a):
+            console.print(f"[red]Error: '{ticker_a}' is not a valid ticker format[/red]")
+            sys.exit(1)
+
         ticker_b = Prompt.ask("[cyan]Second ticker[/cyan]").strip().upper()
         if not ticker_b:
             console.print("[red]Error: Second ticker cannot be empty[/red]")
             sys.exit(1)
 
+        if not _TICKER_RE.match(ticker_b):
+            console.print(f"[red]Error: '{ticker_b}' is not a valid ticker format[/red]")
+            sys.exit(1)
+
         if ticker_a == ticker_b:
             console.print("[red]Error: Please enter two different tickers[/red]")
             sys.exit(1)
@@ -130,9 +208,16 @@ def get_analysis_mode() -> tuple:
         return ("comparison", None, ticker_a, ticker_b)
 
 
-def stream_graph_execution(graph, input_state: dict, config: dict) -> Optional[dict]:
+async def stream_graph_execution(graph, input_state: dict, config: dict) -> Optional[dict]:
     """
-    Execute graph with streaming output display.
+    Execute graph with async streaming output display.
+
+    Streams in two modes simultaneously: "messages" delivers LLM tokens as
+    they are generated, which are appended to a live display so the user
+    sees the first token instead of waiting for the full response;
+    "updates" tracks node completions for final state and interrupt
+    detection. All output goes through a single Live region refreshed at a
+    bounded rate, so stdout writes are batched instead of one per token.
 
     Args:
         graph: Compiled LangGraph
@@ -142,23 +227,95 @@ def stream_graph_execution(graph, input_state: dict, config: dict) -> Optional[d
     Returns:
         Final state after execution (or tuple with interrupt info if interrupted)
     """
+    from langchain_core.messages import AIMessageChunk
+
     try:
         final_state = None
-
-        for event in graph.stream(input_state, config, stream_mode="updates"):
-            if "__interrupt__" in event:
-                # Interrupt encountered - return interrupt tuple
-                return ("__interrupt__", event["__interrupt__"])
-
-            # Display agent updates
-            for node_name, node_state in event.items():
-                if node_name in ["supervisor", "researcher", "analyst"]:
-                    messages = node_state.get("messages", [])
-                    if messages:
-                        last_message = messages[-1]
-                        print_agent_message(node_name, last_message.content)
-
-                final_state = node_state
+        streaming_node = None
+        blocks = []  # completed renderables, in display order
+        stream_buf = None  # Text accumulating the current token stream
+
+        def _display():
+            if stream_buf is not None:
+                return Group(*blocks, stream_buf)
+            return Group(*blocks)
+
+        with Live(Group(), console=console, refresh_per_second=30) as live:
+            async for mode, payload in graph.astream(
+                input_state, config, stream_mode=["updates", "messages"]
+            ):
+                if mode == "messages":
+                    # Token-level chunk from an LLM call inside a node.
+                    # The messages stream also re-emits each full message
+                    # written to state; only AIMessageChunk instances are
+                    # live tokens - everything else renders (once) via the
+                    # updates branch below
+                    chunk, metadata = payload
+                    if not isinstance(chunk, AIMessageChunk) or not chunk.content:
+                        continue
+
+                    node = metadata.get("langgraph_node", "")
+                    if node != streaming_node:
+                        blocks.append(_agent_header(node))
+                        stream_buf = Text()
+                        streaming_node = node
+
+                    stream_buf.append(chunk.content)
+                    live.update(_display())
+                    continue
+
+                # mode == "updates": a node finished
+                event = payload
+                if "__interrupt__" in event:
+                    # Interrupt encountered - return interrupt tuple
+                    return ("__interrupt__", event["__interrupt__"])
+
+                if not _RENDER_NODES & event.keys():
+                    # Bookkeeping-only event - nothing to render
+                    final_state = next(
+                        (v for v in event.values() if v is not None), final_state
+                    )
+                    continue
+
+                rendered_state = None
+                last_state = None
+                for node_name, node_state in event.items():
+                    if node_state is None:
+                        # A bare Command(goto=...) routing hop streams as
+                        # None (the supervisor no longer posts status
+                        # messages) - nothing to render or capture
+                        continue
+                    last_state = node_state
+                    if node_name in _RENDER_NODES:
+                        rendered_state = node_state
+                        if node_name == streaming_node:
+                            # Content already rendered token-by-token;
+                            # freeze the buffer into the finished blocks
+                            blocks.append(stream_buf)
+                            stream_buf = None
+                            streaming_node = None
+                        else:
+                            messages = node_state.get("messages", [])
+                            if messages:
+                                key = node_name.lower()
+                                color = _AGENT_COLORS.get(key, "white")
+                                blocks.append(_agent_header(node_name))
+                                blocks.append(Panel(
+                                    Text(messages[-1].content),
+                                    border_style=color,
+                                    box=box.ROUNDED
+                                ))
+                        live.update(_display())
+
+                # Capture state once per event, preferring the rendered
+                # agent's update - assigning inside the loop overwrote
+                # final_state with whichever entry happened to iterate last.
+                # Keep the previous capture when the event carried only
+                # None updates.
+                if rendered_state is not None:
+                    final_state = rendered_state
+                elif last_state is not None:
+                    final_state = last_state
 
         return final_state
 
@@ -168,7 +325,7 @@ def stream_graph_execution(graph, input_state: dict, config: dict) -> Optional[d
         return None
 
 
-def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
+async def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
     """
     Handle human-in-the-loop interrupt.
 
@@ -180,6 +337,8 @@ def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
     Returns:
         Final state after resume
     """
+    from langgraph.types import Command
+
     # Extract prompt text from interrupt data
     # LangGraph returns a list/tuple of Interrupt objects with a 'value' attribute
     if isinstance(interrupt_data, (list, tuple)) and len(interrupt_data) > 0:
@@ -192,9 +351,9 @@ def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
     else:
         prompt_text = str(interrupt_data)
 
-    console.print("\n" + "="*80, style="yellow")
+    console.print("\n" + _SEP80, style="yellow")
     console.print("[bold yellow]>> HUMAN REVIEW REQUIRED[/bold yellow]")
-    console.print("="*80 + "\n", style="yellow")
+    console.print(_SEP80 + "\n", style="yellow")
 
     console.print(Panel(
         prompt_text,
@@ -204,10 +363,7 @@ def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
     ))
 
     # Get user decision
-    console.print("\n[bold]Options:[/bold]")
-    console.print("  • Type [green]APPROVE[/green] to accept the recommendation")
-    console.print("  • Type [red]REJECT[/red] to decline the recommendation")
-    console.print("  • Or provide custom feedback\n")
+    console.print(_DECISION_HELP)
 
     user_input = Prompt.ask("[bold cyan]Your decision[/bold cyan]")
 
@@ -217,13 +373,13 @@ def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
     try:
         # Resume using Command(resume=...)
         final_state = None
-        for event in graph.stream(
+        async for event in graph.astream(
             Command(resume=user_input),
             config,
             stream_mode="updates"
         ):
             for node_name, node_state in event.items():
-                if node_name in ["supervisor", "human_review"]:
+                if node_name in _RESUME_NODES:
                     messages = node_state.get("messages", [])
                     if messages:
                         last_message = messages[-1]
@@ -239,7 +395,63 @@ def handle_interrupt(graph, interrupt_data, config: dict) -> Optional[dict]:
         return None
 
 
-def run_analysis(mode: str, ticker: Optional[str] = None, ticker_a: Optional[str] = None, ticker_b: Optional[str] = None):
+@lru_cache(maxsize=1)
+def _get_graph(persistent: bool = False):
+    """
+    Build the compiled graph once and reuse it across analyses.
+
+    Graph compilation (node wiring, checkpointer init) is pure overhead on
+    repeat runs - only the thread config needs to change between sessions.
+    Interactive sessions keep checkpoints in memory; threads never outlive
+    the process, so there is no reason to fsync state to disk per update.
+    """
+    from src.graph import create_graph
+
+    return create_graph(persistent=persistent)
+
+
+async def run_research_only(graph, ticker: str, config: dict) -> Optional[dict]:
+    """
+    Run a single-mode graph execution just far enough to collect research data.
+
+    Streams a single-stock run and stops consuming events once the researcher
+    node has produced its update, leaving the rest of that sub-run unexecuted.
+    Comparison mode launches two of these concurrently so the network-bound
+    research for each ticker overlaps instead of running back to back.
+
+    Args:
+        graph: Compiled LangGraph
+        ticker: Stock ticker symbol
+        config: Thread configuration for the sub-run
+
+    Returns:
+        Research data dict for the ticker, or None on failure
+    """
+    from langchain_core.messages import HumanMessage
+
+    input_state = {
+        "messages": [HumanMessage(content=f"Analyze stock {ticker}")],
+        "mode": "single",
+        "ticker": ticker
+    }
+
+    try:
+        async for event in graph.astream(input_state, config, stream_mode="updates"):
+            if "researcher" in event:
+                node_state = event["researcher"]
+                messages = node_state.get("messages", [])
+                if messages:
+                    print_agent_message("researcher", messages[-1].content)
+                return node_state.get("research_data")
+        return None
+
+    except Exception as e:
+        console.print(f"[bold red]Research failed for {ticker}: {e}[/bold red]")
+        logger.error(f"Research error for {ticker}: {e}", exc_info=True)
+        return None
+
+
+async def run_analysis(mode: str, ticker: Optional[str] = None, ticker_a: Optional[str] = None, ticker_b: Optional[str] = None):
     """
     Run complete stock analysis workflow.
 
@@ -249,6 +461,10 @@ def run_analysis(mode: str, ticker: Optional[str] = None, ticker_a: Optional[str
         ticker_a: First stock ticker (for comparison mode)
         ticker_b: Second stock ticker (for comparison mode)
     """
+    from langchain_core.messages import HumanMessage
+    from src.config import Config
+    from src.graph import create_thread_config
+
     if mode == "comparison":
         console.print(f"\n[bold cyan]Starting comparison: {ticker_a} vs {ticker_b}...[/bold cyan]\n")
     else:
@@ -258,22 +474,34 @@ def run_analysis(mode: str, ticker: Optional[str] = None, ticker_a: Optional[str
         # Validate configuration
         Config.validate()
 
-        # Create graph
-        with console.status("[bold green]Initializing multi-agent system...", spinner="dots"):
-            graph = create_graph()
+        # Create graph (compiled once, cached for subsequent analyses)
+        if _get_graph.cache_info().currsize == 0:
+            with console.status("[bold green]Initializing multi-agent system...", spinner="dots"):
+                graph = _get_graph()
+        else:
+            graph = _get_graph()
 
         # Create thread config
-        thread_id = f"session-{uuid.uuid4().hex[:8]}"
+        thread_id = f"session-{os.urandom(4).hex()}"
         config = create_thread_config(thread_id)
         logger.info(f"Session thread: {thread_id}")
 
         # Build initial input based on mode
         if mode == "comparison":
+            # Research both tickers concurrently in independent sub-runs,
+            # then seed the comparison run with the gathered data so the
+            # supervisor routes straight to the comparative analyst.
+            research_a, research_b = await asyncio.gather(
+                run_research_only(graph, ticker_a, create_thread_config(f"{thread_id}-a")),
+                run_research_only(graph, ticker_b, create_thread_config(f"{thread_id}-b"))
+            )
             input_state = {
                 "messages": [HumanMessage(content=f"Compare stocks {ticker_a} vs {ticker_b}")],
                 "mode": "comparison",
                 "ticker_a": ticker_a,
-                "ticker_b": ticker_b
+                "ticker_b": ticker_b,
+                "research_data_a": research_a,
+                "research_data_b": research_b
             }
         else:
             input_state = {
@@ -283,18 +511,18 @@ def run_analysis(mode: str, ticker: Optional[str] = None, ticker_a: Optional[str
             }
 
         # Execute graph with streaming
-        result = stream_graph_execution(graph, input_state, config)
+        result = await stream_graph_execution(graph, input_state, config)
 
         # Handle interrupt if present
         if result and isinstance(result, tuple) and result[0] == "__interrupt__":
             interrupt_data = result[1]
-            result = handle_interrupt(graph, interrupt_data, config)
+            result = await handle_interrupt(graph, interrupt_data, config)
 
         # Display final result
         if result and isinstance(result, dict):
-            console.print("\n" + "="*80, style="green")
+            console.print("\n" + _SEP80, style="green")
             console.print("[bold green][OK] ANALYSIS COMPLETE[/bold green]")
-            console.print("="*80 + "\n", style="green")
+            console.print(_SEP80 + "\n", style="green")
 
             if result.get("user_decision"):
                 console.print(Panel(
@@ -317,18 +545,19 @@ def main():
     """Main CLI entry point."""
     print_banner()
 
-    # Get analysis mode and ticker(s) from user
-    mode, ticker, ticker_a, ticker_b = get_analysis_mode()
+    while True:
+        # Get analysis mode and ticker(s) from user
+        mode, ticker, ticker_a, ticker_b = get_analysis_mode()
 
-    # Run analysis based on mode
-    run_analysis(mode=mode, ticker=ticker, ticker_a=ticker_a, ticker_b=ticker_b)
+        # Run analysis based on mode
+        asyncio.run(run_analysis(mode=mode, ticker=ticker, ticker_a=ticker_a, ticker_b=ticker_b))
 
-    # Ask to analyze another
-    console.print()
-    if Confirm.ask("[cyan]Run another analysis?[/cyan]"):
-        main()
-    else:
-        console.print("\n[bold green]Thank you for using Stock Intelligence![/bold green]\n")
+        # Ask to analyze another
+        console.print()
+        if not Confirm.ask("[cyan]Run another analysis?[/cyan]"):
+            break
+
+    console.print("\n[bold green]Thank you for using Stock Intelligence![/bold green]\n")
 
 
 if __name__ == "__main__":
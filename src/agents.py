@@ -5,16 +5,92 @@ Each agent is a pure function that receives state, performs actions,
 and returns state updates (following LangGraph best practices).
 """
 
+import re
+from enum import IntEnum
 from typing import Literal
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langgraph.types import Command
+from langgraph.types import Command, Send
 from src.state import AgentState
-from src.tools import fetch_stock_data, format_research_summary, format_comparison_summary
+from src.tools import fetch_stock_data_async, format_research_summary, format_comparison_summary
 from src.config import create_llm
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Ticker extraction: one C-level regex scan per message instead of a Python
+# loop over every word. Matching case-insensitively and upper-casing only
+# the candidate words avoids copying the whole message just to scan it.
+# Common words that happen to look like tickers are filtered with an O(1)
+# set lookup.
+_TICKER_RE = re.compile(r"\b[A-Za-z]{1,5}\b")
+_TICKER_STOPWORDS = frozenset({
+    "THE", "A", "AN", "AND", "OF", "FOR", "TO", "IS",
+    "BUY", "SELL", "HOLD", "STOCK", "VS"
+})
+
+
+class _Phase(IntEnum):
+    """Workflow phases, in execution order."""
+    RESEARCH = 1
+    ANALYZE = 2
+    REVIEW = 3
+    DONE = 4
+
+
+# Routing table: phase -> goto target. The comparison research fan-out is
+# special-cased in supervisor_node since it builds Send objects rather
+# than a static goto.
+_PHASE_ROUTES = {
+    _Phase.RESEARCH: "researcher",
+    _Phase.ANALYZE: "analyst",
+    _Phase.REVIEW: "human_review",
+}
+
+# Analyst prompts: the static parts are built once at import; only the
+# research summary is interpolated per call.
+#
+# Token budgets cap each response at what its format actually needs: a
+# single-stock analysis fits comfortably in ~900 tokens and the two-stock
+# head-to-head in ~1400, so the default 2048 ceiling just adds latency
+# and cost on the rare run that rambles.
+_SINGLE_ANALYSIS_MAX_TOKENS = 900
+_COMPARISON_ANALYSIS_MAX_TOKENS = 1400
+_SINGLE_ANALYSIS_SYSTEM = SystemMessage(content="""You are an expert financial analyst. Analyze the provided stock research data and provide:
+
+1. Investment Recommendation: BUY, HOLD, or SELL
+2. Confidence Level: High, Medium, or Low
+3. Key Rationale: 3-5 bullet points explaining your recommendation
+4. Risk Factors: 2-3 potential concerns
+5. Price Target: 6-month price estimate
+
+Be objective, data-driven, and clearly explain your reasoning. Format your response clearly.""")
+
+_SINGLE_ANALYSIS_USER_TMPL = """Analyze this stock research and provide your investment recommendation:
+
+{summary}
+
+Provide a comprehensive investment analysis following the structured format."""
+
+_COMPARISON_ANALYSIS_SYSTEM = SystemMessage(content="""You are an expert financial analyst specializing in comparative stock analysis. Analyze the two stocks and provide:
+
+1. **Winner Pick**: Which stock is the better investment right now and why (one clear choice)
+2. **Head-to-Head Analysis**: Compare the two stocks across key dimensions:
+   - Valuation (P/E, PEG, forward P/E)
+   - Growth prospects (revenue growth, earnings trends)
+   - Financial health (margins, balance sheet strength)
+   - Risk profile (beta, volatility)
+3. **Key Differentiators**: 3-4 factors that most distinguish these two investments
+4. **Risk Factors for Each**: 2-3 specific concerns for each stock
+5. **Investment Scenarios**: When would you prefer Stock A over Stock B, and vice versa?
+
+Be objective, data-driven, and clearly explain your reasoning. Make a definitive recommendation.""")
+
+_COMPARISON_ANALYSIS_USER_TMPL = """Compare these two stocks and determine which is the better investment:
+
+{summary}
+
+Provide a comprehensive head-to-head analysis and pick a winner."""
+
 
 def supervisor_node(state: AgentState) -> Command[Literal["researcher", "analyst", "human_review", "__end__"]]:
     """
@@ -32,100 +108,94 @@ def supervisor_node(state: AgentState) -> Command[Literal["researcher", "analyst
     Returns:
         Command specifying next agent to invoke
     """
-    is_comparison = state.mode == "comparison"
+    is_comparison = state.get("mode") == "comparison"
 
     # Determine if research is complete based on mode
     if is_comparison:
-        research_complete = state.research_data_a is not None and state.research_data_b is not None
-    else:
-        research_complete = state.research_data is not None
-
-    # Initial request - route to researcher
-    if not research_complete:
-        logger.info("Supervisor: Routing to researcher agent")
-        mode_msg = "comparison" if is_comparison else "single stock"
-        return Command(
-            goto="researcher",
-            update={
-                "messages": [
-                    SystemMessage(content=f"Supervisor: Initiating {mode_msg} research.")
-                ]
-            }
-        )
-
-    # Research complete but no analysis - route to analyst
-    if research_complete and not state.analysis_summary:
-        logger.info("Supervisor: Routing to analyst agent")
-        return Command(
-            goto="analyst",
-            update={
-                "messages": [
-                    SystemMessage(content="Supervisor: Research complete, analyzing data.")
-                ]
-            }
+        research_complete = (
+            state.get("research_data_a") is not None
+            and state.get("research_data_b") is not None
         )
+    else:
+        research_complete = state.get("research_data") is not None
+
+    # Classify the workflow phase once, then dispatch via the routing table
+    phase = (
+        _Phase.DONE if state.get("user_decision")
+        else _Phase.REVIEW if state.get("analysis_summary")
+        else _Phase.ANALYZE if research_complete
+        else _Phase.RESEARCH
+    )
 
-    # Analysis complete but no human decision - route to human review
-    if state.analysis_summary and not state.user_decision:
-        logger.info("Supervisor: Routing to human review")
+    if phase is _Phase.RESEARCH and is_comparison:
+        # Fan out one researcher run per missing ticker via the Send
+        # API - LangGraph executes them in parallel and merges their
+        # slot-specific updates in the same superstep
+        logger.info("Supervisor: Fanning out comparison research")
+        sends = []
+        if state.get("research_data_a") is None:
+            sends.append(Send("researcher", {"ticker": state.get("ticker_a"), "comparison_slot": "a"}))
+        if state.get("research_data_b") is None:
+            sends.append(Send("researcher", {"ticker": state.get("ticker_b"), "comparison_slot": "b"}))
+        return Command(goto=sends)
+
+    if phase is _Phase.DONE:
+        # Human decision already recorded - normally human_review ends the
+        # graph itself; this covers a thread resumed past that point
+        logger.info("Supervisor: Workflow complete")
         return Command(
-            goto="human_review",
+            goto="__end__",
             update={
                 "messages": [
-                    SystemMessage(content="Supervisor: Analysis ready for human review.")
+                    AIMessage(content=f"Workflow complete. User decision: {state.get('user_decision')}")
                 ]
             }
         )
 
-    # Human decision received - end workflow
-    logger.info("Supervisor: Workflow complete")
-    return Command(
-        goto="__end__",
-        update={
-            "messages": [
-                AIMessage(content=f"Workflow complete. User decision: {state.user_decision}")
-            ]
-        }
-    )
+    # Status is log-only: appending a SystemMessage per hop made every
+    # subsequent checkpoint serialize the whole growing transcript again
+    goto = _PHASE_ROUTES[phase]
+    logger.info(f"Supervisor: Routing to {goto}")
+    return Command(goto=goto)
 
 
-def researcher_node(state: AgentState) -> Command[Literal["supervisor"]]:
+async def researcher_node(state: AgentState) -> Command[Literal["supervisor"]]:
     """
-    Researcher agent that fetches stock data using yfinance.
+    Researcher agent that fetches stock data for a single ticker.
 
     Responsibilities:
     - Extract ticker symbol from user messages
     - Fetch comprehensive stock data
-    - Store data in state.research_data (single) or research_data_a/b (comparison)
+    - Store data in state.research_data, or research_data_a/b when running
+      as one side of a comparison fan-out (comparison_slot set via Send)
     - Return to supervisor
 
     Args:
-        state: Current AgentState
+        state: Current AgentState, or the Send payload dict when invoked
+            from the comparison fan-out (both are plain dicts)
 
     Returns:
         Command routing back to supervisor with research data
     """
     logger.info("Researcher agent: Starting research")
+    return await _research_single(state)
 
-    # Check if we're in comparison mode
-    if state.mode == "comparison":
-        return _research_comparison(state)
-    else:
-        return _research_single(state)
 
+async def _research_single(state: AgentState) -> Command[Literal["supervisor"]]:
+    """Handle research for one ticker, honoring the comparison slot."""
+    slot = state.get("comparison_slot")
+    data_field = f"research_data_{slot}" if slot else "research_data"
 
-def _research_single(state: AgentState) -> Command[Literal["supervisor"]]:
-    """Handle single stock research."""
     # Extract ticker from latest user message
-    ticker = state.ticker
+    ticker = state.get("ticker")
     if not ticker:
         # Parse from messages if not explicitly set
-        for msg in reversed(state.messages):
+        for msg in reversed(state.get("messages", [])):
             if isinstance(msg, HumanMessage):
                 # Simple extraction (could use LLM for more complex parsing)
-                words = msg.content.upper().split()
-                for word in words:
-                    if len(word) <= 5 and word.isalpha():
+                for match in _TICKER_RE.finditer(msg.content):
+                    word = match.group(0).upper()
+                    if word not in _TICKER_STOPWORDS:
                         ticker = word
                         break
                 if ticker:
@@ -138,96 +208,46 @@ def _research_single(state: AgentState) -> Command[Literal["supervisor"]]:
             goto="supervisor",
             update={
                 "messages": [AIMessage(content=error_msg)],
-                "research_data": {"error": error_msg}
+                data_field: {"error": error_msg}
             }
         )
 
-    # Fetch data
+    # Fetch data - yfinance is blocking, so run it on a worker thread to
+    # keep the event loop free for other graph work
     try:
         logger.info(f"Fetching data for {ticker}")
-        research_data = fetch_stock_data(ticker)
+        research_data = await fetch_stock_data_async(ticker)
         summary = format_research_summary(research_data)
 
-        return Command(
-            goto="supervisor",
-            update={
-                "ticker": ticker,
-                "research_data": research_data,
-                "messages": [
-                    AIMessage(
-                        content=f"Research complete for {ticker}. Key data collected:\n{summary}"
-                    )
-                ]
-            }
-        )
-    except Exception as e:
-        error_msg = f"Research failed: {str(e)}"
-        logger.error(error_msg)
-        return Command(
-            goto="supervisor",
-            update={
-                "messages": [AIMessage(content=error_msg)],
-                "research_data": {"error": error_msg}
-            }
-        )
-
-
-def _research_comparison(state: AgentState) -> Command[Literal["supervisor"]]:
-    """Handle comparison mode research for two stocks."""
-    ticker_a = state.ticker_a
-    ticker_b = state.ticker_b
-
-    if not ticker_a or not ticker_b:
-        error_msg = "Comparison mode requires two ticker symbols (ticker_a and ticker_b)."
-        logger.error(error_msg)
-        return Command(
-            goto="supervisor",
-            update={
-                "messages": [AIMessage(content=error_msg)],
-                "research_data_a": {"error": error_msg},
-                "research_data_b": {"error": error_msg}
-            }
-        )
-
-    try:
-        # Fetch data for both stocks sequentially
-        logger.info(f"Fetching data for {ticker_a}")
-        research_data_a = fetch_stock_data(ticker_a)
-
-        logger.info(f"Fetching data for {ticker_b}")
-        research_data_b = fetch_stock_data(ticker_b)
-
-        # Format comparison summary
-        comparison_summary = format_comparison_summary(research_data_a, research_data_b)
-
-        return Command(
-            goto="supervisor",
-            update={
-                "ticker_a": ticker_a,
-                "ticker_b": ticker_b,
-                "research_data_a": research_data_a,
-                "research_data_b": research_data_b,
-                "messages": [
-                    AIMessage(
-                        content=f"Research complete for {ticker_a} vs {ticker_b}. Comparison data collected:\n{comparison_summary}"
-                    )
-                ]
-            }
-        )
+        update = {
+            data_field: research_data,
+            "messages": [
+                AIMessage(
+                    content=f"Research complete for {ticker}. Key data collected:\n{summary}"
+                )
+            ]
+        }
+        if not slot:
+            update["ticker"] = ticker
+            # Cache the rendered summary so the analyst reuses it instead
+            # of walking the research dict again (slotted runs would race
+            # on the shared field, so only single mode caches)
+            update["research_summary"] = summary
+
+        return Command(goto="supervisor", update=update)
     except Exception as e:
-        error_msg = f"Research failed: {str(e)}"
+        error_msg = f"Research failed for {ticker}: {str(e)}"
         logger.error(error_msg)
         return Command(
             goto="supervisor",
             update={
                 "messages": [AIMessage(content=error_msg)],
-                "research_data_a": {"error": error_msg},
-                "research_data_b": {"error": error_msg}
+                data_field: {"error": error_msg}
             }
         )
 
 
-def analyst_node(state: AgentState) -> Command[Literal["supervisor"]]:
+async def analyst_node(state: AgentState) -> Command[Literal["supervisor"]]:
     """
     Analyst agent that synthesizes research into investment recommendation.
 
@@ -246,15 +266,15 @@ def analyst_node(state: AgentState) -> Command[Literal["supervisor"]]:
     logger.info("Analyst agent: Starting analysis")
 
     # Check if we're in comparison mode
-    if state.mode == "comparison":
-        return _analyze_comparison(state)
+    if state.get("mode") == "comparison":
+        return await _analyze_comparison(state)
     else:
-        return _analyze_single(state)
+        return await _analyze_single(state)
 
 
-def _analyze_single(state: AgentState) -> Command[Literal["supervisor"]]:
+async def _analyze_single(state: AgentState) -> Command[Literal["supervisor"]]:
     """Handle single stock analysis."""
-    if not state.research_data or "error" in state.research_data:
+    if not state.get("research_data") or "error" in state.get("research_data", {}):
         return Command(
             goto="supervisor",
             update={
@@ -264,36 +284,26 @@ def _analyze_single(state: AgentState) -> Command[Literal["supervisor"]]:
             }
         )
 
-    # Format research for LLM
-    research_summary = format_research_summary(state.research_data)
-
-    # Create analysis prompt
-    system_prompt = """You are an expert financial analyst. Analyze the provided stock research data and provide:
-
-1. Investment Recommendation: BUY, HOLD, or SELL
-2. Confidence Level: High, Medium, or Low
-3. Key Rationale: 3-5 bullet points explaining your recommendation
-4. Risk Factors: 2-3 potential concerns
-5. Price Target: 6-month price estimate
-
-Be objective, data-driven, and clearly explain your reasoning. Format your response clearly."""
-
-    user_prompt = f"""Analyze this stock research and provide your investment recommendation:
-
-{research_summary}
-
-Provide a comprehensive investment analysis following the structured format."""
+    # Format research for LLM (reuse the researcher's cached rendering)
+    research_summary = state.get("research_summary") or format_research_summary(state.get("research_data"))
 
     try:
-        llm = create_llm(temperature=0.3)  # Lower temperature for analytical tasks
+        # Lower temperature for analytical tasks
+        llm = create_llm(temperature=0.3, max_tokens=_SINGLE_ANALYSIS_MAX_TOKENS)
 
         messages_for_llm = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
+            _SINGLE_ANALYSIS_SYSTEM,
+            HumanMessage(content=_SINGLE_ANALYSIS_USER_TMPL.format(summary=research_summary))
         ]
 
-        response = llm.invoke(messages_for_llm)
-        analysis = response.content
+        # Stream the completion so tokens surface through the graph's
+        # "messages" stream mode as they arrive; the full text is still
+        # assembled here for state
+        buf = []
+        async for chunk in llm.astream(messages_for_llm):
+            if chunk.content:
+                buf.append(chunk.content)
+        analysis = "".join(buf)
 
         logger.info("Analysis complete")
         return Command(
@@ -302,7 +312,7 @@ Provide a comprehensive investment analysis following the structured format."""
                 "analysis_summary": analysis,
                 "messages": [
                     AIMessage(
-                        content=f"Investment Analysis for {state.ticker}:\n\n{analysis}"
+                        content=f"Investment Analysis for {state.get('ticker')}:\n\n{analysis}"
                     )
                 ]
             }
@@ -319,72 +329,58 @@ Provide a comprehensive investment analysis following the structured format."""
         )
 
 
-def _analyze_comparison(state: AgentState) -> Command[Literal["supervisor"]]:
+async def _analyze_comparison(state: AgentState) -> Command[Literal["supervisor"]]:
     """Handle comparative analysis of two stocks."""
     # Validate we have data for both stocks
-    if not state.research_data_a or "error" in state.research_data_a:
+    if not state.get("research_data_a") or "error" in state.get("research_data_a", {}):
         return Command(
             goto="supervisor",
             update={
                 "messages": [
-                    AIMessage(content=f"Cannot analyze: No valid research data for {state.ticker_a}.")
+                    AIMessage(content=f"Cannot analyze: No valid research data for {state.get('ticker_a')}.")
                 ]
             }
         )
 
-    if not state.research_data_b or "error" in state.research_data_b:
+    if not state.get("research_data_b") or "error" in state.get("research_data_b", {}):
         return Command(
             goto="supervisor",
             update={
                 "messages": [
-                    AIMessage(content=f"Cannot analyze: No valid research data for {state.ticker_b}.")
+                    AIMessage(content=f"Cannot analyze: No valid research data for {state.get('ticker_b')}.")
                 ]
             }
         )
 
-    # Format comparison summary for LLM
-    comparison_summary = format_comparison_summary(state.research_data_a, state.research_data_b)
-
-    # Create comparative analysis prompt
-    system_prompt = """You are an expert financial analyst specializing in comparative stock analysis. Analyze the two stocks and provide:
-
-1. **Winner Pick**: Which stock is the better investment right now and why (one clear choice)
-2. **Head-to-Head Analysis**: Compare the two stocks across key dimensions:
-   - Valuation (P/E, PEG, forward P/E)
-   - Growth prospects (revenue growth, earnings trends)
-   - Financial health (margins, balance sheet strength)
-   - Risk profile (beta, volatility)
-3. **Key Differentiators**: 3-4 factors that most distinguish these two investments
-4. **Risk Factors for Each**: 2-3 specific concerns for each stock
-5. **Investment Scenarios**: When would you prefer Stock A over Stock B, and vice versa?
-
-Be objective, data-driven, and clearly explain your reasoning. Make a definitive recommendation."""
-
-    user_prompt = f"""Compare these two stocks and determine which is the better investment:
-
-{comparison_summary}
-
-Provide a comprehensive head-to-head analysis and pick a winner."""
+    # Format comparison summary for LLM (cached in state for later hops)
+    comparison_summary = state.get("comparison_summary") or format_comparison_summary(
+        state.get("research_data_a"), state.get("research_data_b")
+    )
 
     try:
-        llm = create_llm(temperature=0.3)
+        llm = create_llm(temperature=0.3, max_tokens=_COMPARISON_ANALYSIS_MAX_TOKENS)
 
         messages_for_llm = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
+            _COMPARISON_ANALYSIS_SYSTEM,
+            HumanMessage(content=_COMPARISON_ANALYSIS_USER_TMPL.format(summary=comparison_summary))
         ]
 
-        response = llm.invoke(messages_for_llm)
-        analysis = response.content
+        # Streamed for the same reason as the single-stock path
+        buf = []
+        async for chunk in llm.astream(messages_for_llm):
+            if chunk.content:
+                buf.append(chunk.content)
+        analysis = "".join(buf)
 
         logger.info("Comparison analysis complete")
         return Command(
             goto="supervisor",
             update={
                 "analysis_summary": analysis,
+                "comparison_summary": comparison_summary,
                 "messages": [
                     AIMessage(
-                        content=f"Comparative Analysis: {state.ticker_a} vs {state.ticker_b}:\n\n{analysis}"
+                        content=f"Comparative Analysis: {state.get('ticker_a')} vs {state.get('ticker_b')}:\n\n{analysis}"
                     )
                 ]
             }
@@ -401,34 +397,37 @@ Provide a comprehensive head-to-head analysis and pick a winner."""
         )
 
 
-def human_review_node(state: AgentState) -> Command[Literal["supervisor"]]:
+def human_review_node(state: AgentState) -> Command[Literal["__end__"]]:
     """
     Human-in-the-loop review node using interrupt().
 
     This node triggers an interrupt to pause execution and collect
     human approval/rejection. Execution resumes via Command(resume=...).
+    The decision is terminal, so the node routes straight to END rather
+    than bouncing through the supervisor for one more checkpointed
+    super-step just to be told the workflow is done.
 
     Args:
         state: Current AgentState with analysis_summary
 
     Returns:
-        Command routing back to supervisor after human input
+        Command ending the workflow with the recorded decision
     """
     from langgraph.types import interrupt
 
     logger.info("Human review: Triggering interrupt for approval")
 
     # Create header based on mode
-    if state.mode == "comparison":
-        header = f"Comparison: {state.ticker_a} vs {state.ticker_b}"
+    if state.get("mode") == "comparison":
+        header = f"Comparison: {state.get('ticker_a')} vs {state.get('ticker_b')}"
     else:
-        header = f"Analysis: {state.ticker}"
+        header = f"Analysis: {state.get('ticker')}"
 
     # Present analysis and request approval
     prompt = f"""
 ### {header}
 
-{state.analysis_summary}
+{state.get('analysis_summary')}
 
 ---
 
@@ -458,7 +457,7 @@ Please respond with:
         message = f"Thank you for your feedback: {user_input}"
 
     return Command(
-        goto="supervisor",
+        goto="__end__",
         update={
             "user_decision": outcome,
             "messages": [
@@ -5,6 +5,8 @@ Handles OpenRouter integration with LangChain's ChatOpenAI interface.
 """
 
 import os
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
@@ -12,8 +14,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once per process; re-imports and subprocess
+# re-execs skip the .env file scan
+if not os.getenv("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
 class Config:
@@ -34,22 +39,74 @@ class Config:
     )
     OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
     SQLITE_DB_PATH: str = os.getenv("SQLITE_DB_PATH", "./data/checkpoints.db")
+    YF_CACHE_PATH: str = os.getenv("YF_CACHE_PATH", "./data/yf_cache.sqlite")
 
     # LLM generation parameters
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
     MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "2048"))
 
+    _http_session = None
+    _validated: bool = False
+
+    @classmethod
+    def get_session(cls):
+        """
+        Shared cached HTTP session for yfinance requests.
+
+        Responses are persisted to SQLite, so repeated lookups for the
+        same ticker within the expiry window are served locally instead of
+        re-hitting Yahoo - faster and far less likely to trip rate limits.
+        Cache misses reuse pooled keep-alive connections, so only the very
+        first request to a host pays the TCP + TLS handshake.
+
+        Returns:
+            requests_cache.CachedSession shared across all fetches
+        """
+        if cls._http_session is None:
+            import requests_cache
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            os.makedirs(os.path.dirname(cls.YF_CACHE_PATH) or ".", exist_ok=True)
+            session = requests_cache.CachedSession(
+                cls.YF_CACHE_PATH,
+                expire_after=timedelta(hours=6),
+                allowable_codes=(200,),
+            )
+            # Browser-style UA set once on the session; Yahoo throttles
+            # the python-requests default aggressively
+            session.headers["User-Agent"] = (
+                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+            )
+            session.mount("https://", HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                ),
+            ))
+            cls._http_session = session
+            logger.info(f"HTTP cache initialized at {cls.YF_CACHE_PATH}")
+        return cls._http_session
+
     @classmethod
     def validate(cls) -> None:
-        """Validate required environment variables are set."""
+        """Validate required environment variables are set (once per process)."""
+        if cls._validated:
+            return
         if not cls.OPENROUTER_API_KEY:
             raise ValueError(
                 "OPENROUTER_API_KEY not found. "
                 "Please set it in your .env file or environment."
             )
+        cls._validated = True
         logger.info(f"Configuration validated. Using model: {cls.DEFAULT_MODEL}")
 
 
+@lru_cache(maxsize=8)
 def create_llm(
     model: Optional[str] = None,
     temperature: Optional[float] = None,
@@ -58,6 +115,11 @@ def create_llm(
     """
     Create a ChatOpenAI instance configured for OpenRouter.
 
+    Instances are cached per (model, temperature, max_tokens) tuple so the
+    agent nodes reuse one client - and its HTTP connection pool - instead
+    of re-validating config and re-initializing TLS on every analysis.
+    ChatOpenAI is safe to share across invocations.
+
     Args:
         model: Override default model (optional)
         temperature: Override default temperature (optional)
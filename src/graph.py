@@ -4,8 +4,14 @@ LangGraph workflow definition for Stock Intelligence system.
 Constructs the StateGraph with nodes, edges, and checkpointing.
 """
 
+import asyncio
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from langgraph.graph import StateGraph, START
 from langgraph.checkpoint.memory import MemorySaver
+from src.config import Config
 from src.state import AgentState
 from src.agents import (
     supervisor_node,
@@ -18,20 +24,94 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def create_graph():
+async def _open_async_checkpointer(db_path: str):
+    """
+    Open an AsyncSqliteSaver with write-friendly PRAGMAs applied.
+
+    WAL mode lets checkpoint writes interleave with reads instead of
+    serializing on the database lock, and synchronous=NORMAL drops the
+    per-write fsync - plenty durable for resumable CLI sessions.
+
+    Args:
+        db_path: Path to the checkpoint database
+
+    Returns:
+        AsyncSqliteSaver bound to the tuned connection
+    """
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    conn = await aiosqlite.connect(db_path)
+    await conn.execute("PRAGMA journal_mode=WAL")
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    await conn.execute("PRAGMA temp_store=MEMORY")
+    # Read checkpoint pages via mmap (up to 256MB) and keep a 64MB page
+    # cache, so replaying a thread's history doesn't re-read from disk
+    await conn.execute("PRAGMA mmap_size=268435456")
+    await conn.execute("PRAGMA cache_size=-65536")
+    return AsyncSqliteSaver(conn)
+
+
+def _close_checkpointer_blocking(saver) -> None:
+    """
+    Close the saver's aiosqlite connection at interpreter exit.
+
+    aiosqlite runs a non-daemon worker thread per connection; without an
+    explicit close the process hangs on shutdown and the orphaned worker
+    fails its remaining futures against a dead event loop.
+    """
+    try:
+        asyncio.run(saver.conn.close())
+    except Exception as e:
+        logger.warning("Checkpointer close failed: %s", e)
+
+
+def _open_checkpointer_blocking(db_path: str):
+    """
+    Run the async checkpointer setup from synchronous code.
+
+    create_graph may be called either before any event loop exists or
+    from inside a running one (graph creation during an async session),
+    so fall back to a worker thread in the latter case. The connection's
+    teardown is registered with atexit so its worker thread always exits
+    with the process.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        saver = asyncio.run(_open_async_checkpointer(db_path))
+    else:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            saver = pool.submit(asyncio.run, _open_async_checkpointer(db_path)).result()
+
+    atexit.register(_close_checkpointer_blocking, saver)
+    return saver
+
+
+def create_graph(persistent: bool = False):
     """
     Create and compile the LangGraph StateGraph for stock analysis.
 
     Graph Structure:
         START -> supervisor -> researcher -> supervisor -> analyst
-        -> supervisor -> human_review [interrupt] -> supervisor -> END
+        -> supervisor -> human_review [interrupt] -> END
+
+    Args:
+        persistent: When True, checkpoints go to SQLite at
+            Config.SQLITE_DB_PATH so threads survive the process. Defaults
+            to False: interactive CLI threads never outlive the process,
+            and MemorySaver avoids a disk write on every streamed update.
 
     Returns:
-        Compiled graph with SqliteSaver checkpointer
+        Compiled graph with checkpointer attached
     """
     logger.info("Creating StateGraph")
 
-    # Initialize StateGraph with Pydantic state
+    # Fail fast on missing credentials before any node runs; subsequent
+    # validate() calls in create_llm are a no-op flag check
+    Config.validate()
+
+    # Initialize StateGraph with the AgentState TypedDict schema
     workflow = StateGraph(AgentState)
 
     # Add nodes
@@ -51,10 +131,16 @@ def create_graph():
     # The supervisor's Command.goto determines the next node
 
     # Setup checkpointer for persistence
-    # Using MemorySaver instead of SqliteSaver to avoid threading issues
-    # MemorySaver is thread-safe and suitable for single-session usage
-    checkpointer = MemorySaver()
-    logger.info("Checkpointer initialized (MemorySaver)")
+    # MemorySaver is thread-safe and suitable for single-session usage;
+    # SQLite is only worth the per-update write cost when state must
+    # survive the process
+    if persistent:
+        os.makedirs(os.path.dirname(Config.SQLITE_DB_PATH) or ".", exist_ok=True)
+        checkpointer = _open_checkpointer_blocking(Config.SQLITE_DB_PATH)
+        logger.info("Checkpointer initialized (AsyncSqliteSaver, WAL)")
+    else:
+        checkpointer = MemorySaver()
+        logger.info("Checkpointer initialized (MemorySaver)")
 
     # Compile graph with checkpointer
     graph = workflow.compile(checkpointer=checkpointer)
@@ -1,17 +1,19 @@
 """
 State management for the Stock Intelligence Multi-Agent System.
 
-This module defines the AgentState schema using Pydantic BaseModel
-with annotated reducers for message handling.
+This module defines the AgentState schema as a TypedDict with annotated
+reducers for message handling. LangGraph's channels and reducers operate
+directly on TypedDict state, so applying a Command update is a plain dict
+merge - a BaseModel schema would re-run Pydantic field validation on every
+hop, which adds up when research_data is a large payload.
 """
 
-from typing import Annotated, Sequence, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Annotated, Sequence, Optional, Literal, TypedDict
 from langchain_core.messages import BaseMessage
 from langgraph.graph import add_messages
 
 
-class AgentState(BaseModel):
+class AgentState(TypedDict, total=False):
     """
     Central state container for the multi-agent stock analysis workflow.
 
@@ -19,60 +21,31 @@ class AgentState(BaseModel):
         messages: Conversation history with append-only behavior via add_messages reducer
         ticker: Stock ticker symbol being analyzed (e.g., "AAPL")
         research_data: Raw data collected by researcher agent (JSON serializable dict)
+        research_summary: Formatted research summary, cached so the analyst
+            doesn't re-render the same research data
         analysis_summary: Final investment recommendation from analyst agent
         user_decision: Human approval/rejection from interrupt resume
+        mode: Analysis mode - 'single' for one stock, 'comparison' for two
+        ticker_a: First stock ticker for comparison mode
+        ticker_b: Second stock ticker for comparison mode
+        comparison_slot: Which comparison slot a fanned-out researcher run fills
+        research_data_a: Research data for first stock in comparison mode
+        research_data_b: Research data for second stock in comparison mode
+        comparison_summary: Formatted side-by-side summary for comparison mode
     """
 
-    messages: Annotated[Sequence[BaseMessage], add_messages] = Field(
-        default_factory=list,
-        description="Message history with automatic appending"
-    )
-
-    ticker: Optional[str] = Field(
-        default=None,
-        description="Stock ticker symbol (e.g., AAPL, GOOGL)"
-    )
-
-    research_data: Optional[dict] = Field(
-        default=None,
-        description="Structured data from yfinance: price, fundamentals, news"
-    )
-
-    analysis_summary: Optional[str] = Field(
-        default=None,
-        description="Analyst agent's investment recommendation"
-    )
-
-    user_decision: Optional[str] = Field(
-        default=None,
-        description="Human approval/rejection decision"
-    )
+    messages: Annotated[Sequence[BaseMessage], add_messages]
+    ticker: Optional[str]
+    research_data: Optional[dict]
+    research_summary: Optional[str]
+    analysis_summary: Optional[str]
+    user_decision: Optional[str]
 
     # Comparison mode fields
-    mode: Literal["single", "comparison"] = Field(
-        default="single",
-        description="Analysis mode: 'single' for one stock, 'comparison' for two stocks"
-    )
-
-    ticker_a: Optional[str] = Field(
-        default=None,
-        description="First stock ticker for comparison mode"
-    )
-
-    ticker_b: Optional[str] = Field(
-        default=None,
-        description="Second stock ticker for comparison mode"
-    )
-
-    research_data_a: Optional[dict] = Field(
-        default=None,
-        description="Research data for first stock in comparison mode"
-    )
-
-    research_data_b: Optional[dict] = Field(
-        default=None,
-        description="Research data for second stock in comparison mode"
-    )
-
-    class Config:
-        arbitrary_types_allowed = True  # Required for BaseMessage types
+    mode: Literal["single", "comparison"]
+    ticker_a: Optional[str]
+    ticker_b: Optional[str]
+    comparison_slot: Optional[Literal["a", "b"]]
+    research_data_a: Optional[dict]
+    research_data_b: Optional[dict]
+    comparison_summary: Optional[str]
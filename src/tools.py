@@ -8,28 +8,411 @@ Provides structured data fetching for stock analysis including:
 - Recent news headlines
 """
 
+import asyncio
+import math
+import os
+import threading
+import diskcache
+import pandas as pd
 import yfinance as yf
-from typing import Dict, Any
-from datetime import datetime, timedelta
+from cachetools import LRUCache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from datetime import datetime
 import logging
 import numpy as np
 
+from src.config import Config
+
 logger = logging.getLogger(__name__)
 
+# Disk-backed TTL cache over the individual yfinance calls. The HTTP cache
+# (Config.get_session) already avoids re-hitting Yahoo, but still pays for
+# response parsing on every call; this layer stores the parsed objects,
+# and because CLI processes die between invocations, diskcache persists
+# them so a re-run within the TTL skips the network entirely. Per-key
+# locks keep concurrent fetches of the same ticker from duplicating work.
+_YF_TTL_SECONDS = int(os.getenv("YF_CACHE_TTL", "60"))
+_YF_OBJ_CACHE_DIR = os.getenv(
+    "YF_OBJ_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "cli-stock-picker"),
+)
+_yf_cache = diskcache.Cache(_YF_OBJ_CACHE_DIR, size_limit=64 * 1024 * 1024)
+_yf_cache_lock = threading.Lock()
+_yf_key_locks: Dict[tuple, threading.Lock] = {}
+_MISSING = object()
+
+
+def _cached_fetch(key: tuple, fetch):
+    """Return the cached value for key, computing it at most once at a time."""
+    value = _yf_cache.get(key, default=_MISSING)
+    if value is not _MISSING:
+        return value
+    with _yf_cache_lock:
+        key_lock = _yf_key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another thread may have populated the entry while we waited
+        value = _yf_cache.get(key, default=_MISSING)
+        if value is not _MISSING:
+            return value
+        value = fetch()
+        _yf_cache.set(key, value, expire=_YF_TTL_SECONDS)
+        with _yf_cache_lock:
+            _yf_key_locks.pop(key, None)
+        return value
+
+
+def _cached_info(stock: yf.Ticker, ticker: str) -> Dict[str, Any]:
+    """Fetch stock.info through the TTL cache."""
+    return _cached_fetch((ticker, "info"), lambda: stock.info)
+
+
+def _cached_history(stock: yf.Ticker, ticker: str):
+    """Fetch the ~90-day price history through the TTL cache."""
+    # period="3mo" lets Yahoo resolve the window server-side (no local
+    # date arithmetic, and a stable URL for the HTTP cache), and skipping
+    # dividend/split actions and auto-adjustment avoids fetching and
+    # post-processing columns the trend metrics never read
+    return _cached_fetch(
+        (ticker, "hist90"),
+        lambda: stock.history(period="3mo", interval="1d", actions=False, auto_adjust=False),
+    )
+
+
+def _cached_news(stock: yf.Ticker, ticker: str) -> list:
+    """Fetch the top recent news articles through the TTL cache."""
+    return _cached_fetch((ticker, "news"), lambda: stock.news[:5])
+
+
+# Typed research payload. Frozen slots-dataclasses give the renderers
+# C-level attribute access instead of a dict hash lookup per field, and
+# make the payload shape explicit. Graph state and checkpoints still
+# carry the plain-dict form (as_dict/from_dict round-trip it), so
+# nothing downstream of the JSON boundary changes.
+@dataclass(slots=True, frozen=True)
+class PriceData:
+    """Current price and volume snapshot for one ticker."""
+
+    current_price: Optional[float] = None
+    previous_close: Optional[float] = None
+    day_high: Optional[float] = None
+    day_low: Optional[float] = None
+    week52_high: Optional[float] = None
+    week52_low: Optional[float] = None
+    volume: Optional[int] = None
+    avg_volume: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PriceData":
+        return cls(
+            current_price=d.get("current_price"),
+            previous_close=d.get("previous_close"),
+            day_high=d.get("day_high"),
+            day_low=d.get("day_low"),
+            week52_high=d.get("52_week_high"),
+            week52_low=d.get("52_week_low"),
+            volume=d.get("volume"),
+            avg_volume=d.get("avg_volume"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "current_price": self.current_price,
+            "previous_close": self.previous_close,
+            "day_high": self.day_high,
+            "day_low": self.day_low,
+            "52_week_high": self.week52_high,
+            "52_week_low": self.week52_low,
+            "volume": self.volume,
+            "avg_volume": self.avg_volume,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class Fundamentals:
+    """Valuation and profitability metrics for one ticker."""
+
+    market_cap: Optional[float] = None
+    pe_ratio: Optional[float] = None
+    forward_pe: Optional[float] = None
+    peg_ratio: Optional[float] = None
+    dividend_yield: Optional[float] = None
+    beta: Optional[float] = None
+    eps: Optional[float] = None
+    profit_margin: Optional[float] = None
+    revenue_growth: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Fundamentals":
+        return cls(**{f: d.get(f) for f in cls.__slots__})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {f: getattr(self, f) for f in self.__slots__}
+
+
+@dataclass(slots=True, frozen=True)
+class CompanyInfo:
+    """Company metadata for one ticker."""
+
+    name: Optional[str] = None
+    sector: Optional[str] = None
+    industry: Optional[str] = None
+    description: Optional[str] = None
+    website: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "CompanyInfo":
+        return cls(**{f: d.get(f) for f in cls.__slots__})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {f: getattr(self, f) for f in self.__slots__}
+
+
+@dataclass(slots=True, frozen=True)
+class HistoricalData:
+    """90-day trend metrics for one ticker."""
+
+    return_90d: Optional[float] = None
+    volatility: Optional[float] = None
+    avg_price_90d: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "HistoricalData":
+        return cls(
+            return_90d=d.get("90_day_return"),
+            volatility=d.get("volatility"),
+            avg_price_90d=d.get("avg_price_90d"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "90_day_return": self.return_90d,
+            "volatility": self.volatility,
+            "avg_price_90d": self.avg_price_90d,
+        }
 
-def _convert_to_native_types(obj):
-    """Convert numpy types to native Python types for serialization."""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: _convert_to_native_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [_convert_to_native_types(item) for item in obj]
-    return obj
+
+@dataclass(slots=True, frozen=True)
+class StockData:
+    """Complete research payload for one ticker."""
+
+    ticker: str
+    fetch_timestamp: str
+    company_info: CompanyInfo
+    price_data: PriceData
+    fundamentals: Fundamentals
+    historical_data: HistoricalData
+    news: List[Dict[str, Any]]
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "StockData":
+        return cls(
+            ticker=d["ticker"],
+            fetch_timestamp=d["fetch_timestamp"],
+            company_info=CompanyInfo.from_dict(d["company_info"]),
+            price_data=PriceData.from_dict(d["price_data"]),
+            fundamentals=Fundamentals.from_dict(d["fundamentals"]),
+            historical_data=HistoricalData.from_dict(d["historical_data"]),
+            news=d["news"],
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain-dict form with the established state/JSON key names."""
+        return {
+            "ticker": self.ticker,
+            "fetch_timestamp": self.fetch_timestamp,
+            "company_info": self.company_info.as_dict(),
+            "price_data": self.price_data.as_dict(),
+            "fundamentals": self.fundamentals.as_dict(),
+            "historical_data": self.historical_data.as_dict(),
+            "news": self.news,
+        }
+
+
+# Value formatters shared by the summary renderers. Module-level so
+# they're defined once at import instead of being rebuilt as closures on
+# every (cache-missing) render. Fully annotated so an AOT compiler
+# (mypyc/Cython) could specialize them without changes if rendering ever
+# becomes the bottleneck.
+def _fmt_currency(val: Optional[float]) -> str:
+    return f"${val:.2f}" if val else "N/A"
+
+
+def _fmt_pct(val: Optional[float]) -> str:
+    return f"{val:.2f}%" if val else "N/A"
+
+
+def _fmt_pct_mult(val: Optional[float]) -> str:
+    return f"{val*100:.2f}%" if val else "N/A"
+
+
+def _fmt_float(val: Optional[float]) -> str:
+    return f"{val:.2f}" if val else "N/A"
+
+
+def _fmt_num(val: Optional[int]) -> str:
+    return f"{val:,}" if val else "N/A"
+
+
+# Magnitude buckets for _fmt_num_abbrev, indexed by int(log10(val)) // 3
+_MAG = (("", 1), ("K", 1e3), ("M", 1e6), ("B", 1e9), ("T", 1e12))
+
+
+def _fmt_num_abbrev(val: Optional[float]) -> str:
+    """Format large values with a magnitude suffix ($1.23T / B / M)."""
+    if val is None:
+        return "N/A"
+    idx = min(int(math.log10(val)) // 3, 4) if val > 0 else 0
+    if idx < 2:
+        # Below a million, keep plain thousands separators
+        return f"{val:,}"
+    suffix, divisor = _MAG[idx]
+    return f"${val/divisor:.2f}{suffix}"
+
+
+# Comparison table layout, parsed once at import; _format_comparison_impl
+# only fills in the values via format_map
+_COMPARISON_TMPL = """
+## Stock Comparison: {ticker_a} vs {ticker_b}
+
+### Company Overview
+| Metric | {ticker_a} | {ticker_b} |
+|--------|------------|------------|
+| Name | {name_a} | {name_b} |
+| Sector | {sector_a} | {sector_b} |
+| Industry | {industry_a} | {industry_b} |
+
+### Price Data
+| Metric | {ticker_a} | {ticker_b} |
+|--------|------------|------------|
+| Current Price | {price_a} | {price_b} |
+| Day Range | {day_range_a} | {day_range_b} |
+| 52-Week Range | {week52_range_a} | {week52_range_b} |
+| Volume | {volume_a} | {volume_b} |
+| Avg Volume | {avg_volume_a} | {avg_volume_b} |
+
+### Fundamental Metrics
+| Metric | {ticker_a} | {ticker_b} |
+|--------|------------|------------|
+| Market Cap | {market_cap_a} | {market_cap_b} |
+| P/E Ratio | {pe_ratio_a} | {pe_ratio_b} |
+| Forward P/E | {forward_pe_a} | {forward_pe_b} |
+| PEG Ratio | {peg_ratio_a} | {peg_ratio_b} |
+| Dividend Yield | {dividend_yield_a} | {dividend_yield_b} |
+| Beta | {beta_a} | {beta_b} |
+| EPS | {eps_a} | {eps_b} |
+| Profit Margin | {profit_margin_a} | {profit_margin_b} |
+| Revenue Growth | {revenue_growth_a} | {revenue_growth_b} |
+
+### Performance Trends
+| Metric | {ticker_a} | {ticker_b} |
+|--------|------------|------------|
+| 90-Day Return | {return_90d_a} | {return_90d_b} |
+| Volatility | {volatility_a} | {volatility_b} |
+
+### Recent News - {ticker_a}
+"""
+
+
+def _fetch_news_safe(stock: yf.Ticker, ticker: str) -> list:
+    """Fetch recent news items, degrading to an empty list on failure."""
+    try:
+        news = _cached_news(stock, ticker)  # Top 5 recent articles
+        return [
+            {
+                "title": article.get("title"),
+                "publisher": article.get("publisher"),
+                "link": article.get("link"),
+            }
+            for article in news
+        ]
+    except Exception as e:
+        logger.warning("Could not fetch news for %s: %s", ticker, e)
+        return []
+
+
+def _build_stock_payload(
+    ticker: str,
+    info: Dict[str, Any],
+    history,
+    news_items: list,
+    fetched_at: datetime,
+) -> Dict[str, Any]:
+    """
+    Assemble the research payload from already-fetched raw pieces.
+
+    Shared by the sync and async fetchers so they produce identical
+    payloads regardless of how the pieces were retrieved.
+
+    Raises:
+        ValueError: If the ticker's info is missing or lacks a price
+    """
+    # Validate ticker exists
+    if not info or "regularMarketPrice" not in info:
+        raise ValueError(f"Invalid ticker symbol: {ticker}")
+
+    # Price data
+    price_data = PriceData(
+        current_price=info.get("regularMarketPrice"),
+        previous_close=info.get("previousClose"),
+        day_high=info.get("dayHigh"),
+        day_low=info.get("dayLow"),
+        week52_high=info.get("fiftyTwoWeekHigh"),
+        week52_low=info.get("fiftyTwoWeekLow"),
+        volume=info.get("volume"),
+        avg_volume=info.get("averageVolume"),
+    )
+
+    # Fundamental data
+    fundamentals = Fundamentals(
+        market_cap=info.get("marketCap"),
+        pe_ratio=info.get("trailingPE"),
+        forward_pe=info.get("forwardPE"),
+        peg_ratio=info.get("pegRatio"),
+        dividend_yield=info.get("dividendYield"),
+        beta=info.get("beta"),
+        eps=info.get("trailingEps"),
+        profit_margin=info.get("profitMargins"),
+        revenue_growth=info.get("revenueGrowth"),
+    )
+
+    # Company metadata. The business summary is often several KB and
+    # only the first couple hundred characters ever reach a prompt,
+    # so trim it here rather than carrying the full text through
+    # state, checkpoints, and the formatter caches.
+    description = info.get("longBusinessSummary")
+    company_info = CompanyInfo(
+        name=info.get("longName"),
+        sector=info.get("sector"),
+        industry=info.get("industry"),
+        description=description[:500] if description else None,
+        website=info.get("website"),
+    )
+
+    # Historical trend metrics (90 days), computed on the raw ndarray:
+    # to_numpy(copy=False) views the column's buffer, and the ufunc-based
+    # return/volatility/mean skip the per-call Series machinery of
+    # iloc/pct_change/std
+    closes = history["Close"].to_numpy(copy=False) if len(history) > 0 else np.empty(0)
+    returns = np.diff(closes) / closes[:-1] if closes.size > 1 else np.empty(0)
+    historical_data = HistoricalData(
+        return_90d=float((closes[-1] - closes[0]) / closes[0] * 100) if closes.size > 0 else None,
+        volatility=float(returns.std(ddof=1) * 100) if closes.size > 1 else None,
+        avg_price_90d=float(closes.mean()) if closes.size > 0 else None,
+    )
+
+    # Return the plain-dict form: graph state and checkpoints carry JSON
+    return StockData(
+        ticker=ticker,
+        fetch_timestamp=fetched_at.isoformat(),
+        company_info=company_info,
+        price_data=price_data,
+        fundamentals=fundamentals,
+        historical_data=historical_data,
+        news=news_items,
+    ).as_dict()
 
 
 def fetch_stock_data(ticker: str) -> Dict[str, Any]:
@@ -43,169 +426,246 @@ def fetch_stock_data(ticker: str) -> Dict[str, Any]:
         Dictionary containing:
             - price_data: Current price, day range, 52-week range
             - fundamentals: P/E ratio, market cap, dividend yield
-            - financials: Revenue, earnings, cash flow summaries
-            - news: Recent news headlines (last 7 days)
-            - historical: 90-day price history for trend analysis
+            - company_info: Name, sector, industry, description
+            - news: Recent news headlines
+            - historical_data: 90-day trend metrics
 
     Raises:
         ValueError: If ticker is invalid or data unavailable
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-
-        # Validate ticker exists
-        if not info or "regularMarketPrice" not in info:
-            raise ValueError(f"Invalid ticker symbol: {ticker}")
-
-        # Price data
-        price_data = {
-            "current_price": info.get("regularMarketPrice"),
-            "previous_close": info.get("previousClose"),
-            "day_high": info.get("dayHigh"),
-            "day_low": info.get("dayLow"),
-            "52_week_high": info.get("fiftyTwoWeekHigh"),
-            "52_week_low": info.get("fiftyTwoWeekLow"),
-            "volume": info.get("volume"),
-            "avg_volume": info.get("averageVolume"),
-        }
+        ticker = ticker.upper()
+        stock = yf.Ticker(ticker, session=Config.get_session())
+        fetched_at = datetime.now()
 
-        # Fundamental data
-        fundamentals = {
-            "market_cap": info.get("marketCap"),
-            "pe_ratio": info.get("trailingPE"),
-            "forward_pe": info.get("forwardPE"),
-            "peg_ratio": info.get("pegRatio"),
-            "dividend_yield": info.get("dividendYield"),
-            "beta": info.get("beta"),
-            "eps": info.get("trailingEps"),
-            "profit_margin": info.get("profitMargins"),
-            "revenue_growth": info.get("revenueGrowth"),
-        }
+        info = _cached_info(stock, ticker)
+        history = _cached_history(stock, ticker)
+        news_items = _fetch_news_safe(stock, ticker)
+        return _build_stock_payload(ticker, info, history, news_items, fetched_at)
 
-        # Company metadata
-        company_info = {
-            "name": info.get("longName"),
-            "sector": info.get("sector"),
-            "industry": info.get("industry"),
-            "description": info.get("longBusinessSummary"),
-            "website": info.get("website"),
-        }
+    except Exception as e:
+        logger.error("Error fetching data for %s: %s", ticker, e)
+        raise ValueError(f"Failed to fetch data for {ticker}: {str(e)}")
 
-        # Historical data (90 days for trend analysis)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=90)
-        history = stock.history(start=start_date, end=end_date)
-
-        historical_data = {
-            "90_day_return": (
-                (history["Close"].iloc[-1] - history["Close"].iloc[0])
-                / history["Close"].iloc[0] * 100
-            ) if len(history) > 0 else None,
-            "volatility": history["Close"].pct_change().std() * 100 if len(history) > 1 else None,
-            "avg_price_90d": history["Close"].mean() if len(history) > 0 else None,
-        }
 
-        # Recent news (last 5 articles)
-        news_items = []
-        try:
-            news = stock.news[:5]  # Top 5 recent articles
-            for article in news:
-                news_items.append({
-                    "title": article.get("title"),
-                    "publisher": article.get("publisher"),
-                    "link": article.get("link"),
-                })
-        except Exception as e:
-            logger.warning(f"Could not fetch news for {ticker}: {e}")
-            news_items = []
-
-        # Convert all numpy types to native Python types for serialization
-        result = {
-            "ticker": ticker.upper(),
-            "fetch_timestamp": datetime.now().isoformat(),
-            "company_info": company_info,
-            "price_data": price_data,
-            "fundamentals": fundamentals,
-            "historical_data": historical_data,
-            "news": news_items,
-        }
-        return _convert_to_native_types(result)
+async def fetch_stock_data_async(ticker: str) -> Dict[str, Any]:
+    """
+    Async variant of fetch_stock_data with concurrent sub-requests.
+
+    The info, history, and news lookups are independent HTTP round-trips,
+    so they run in worker threads via asyncio.gather and overlap instead
+    of executing back-to-back. Same payload and error contract as the
+    sync version.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "AAPL")
+
+    Returns:
+        Same payload as fetch_stock_data()
+
+    Raises:
+        ValueError: If ticker is invalid or data unavailable
+    """
+    try:
+        ticker = ticker.upper()
+        stock = yf.Ticker(ticker, session=Config.get_session())
+        fetched_at = datetime.now()
+
+        info, history, news_items = await asyncio.gather(
+            asyncio.to_thread(_cached_info, stock, ticker),
+            asyncio.to_thread(_cached_history, stock, ticker),
+            asyncio.to_thread(_fetch_news_safe, stock, ticker),
+        )
+        return _build_stock_payload(ticker, info, history, news_items, fetched_at)
 
     except Exception as e:
-        logger.error(f"Error fetching data for {ticker}: {e}")
+        logger.error("Error fetching data for %s: %s", ticker, e)
         raise ValueError(f"Failed to fetch data for {ticker}: {str(e)}")
 
 
+async def fetch_stock_data_batch_async(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch research payloads for several tickers concurrently.
+
+    Each ticker runs through fetch_stock_data_async under a semaphore
+    (YF_CONCURRENCY, default 8) so a long list doesn't open unbounded
+    connections to Yahoo. Failed fetches are retried twice with
+    exponential backoff before being recorded as {"error": ...} entries.
+
+    Args:
+        tickers: Ticker symbols to fetch (e.g., ["AAPL", "MSFT"])
+
+    Returns:
+        Mapping of upper-cased ticker to its fetch_stock_data() payload,
+        or {"error": message} for tickers that failed
+    """
+    semaphore = asyncio.Semaphore(int(os.getenv("YF_CONCURRENCY", "8")))
+
+    async def _fetch_one(ticker: str) -> Dict[str, Any]:
+        async with semaphore:
+            delay = 0.5
+            for attempt in range(3):
+                try:
+                    return await fetch_stock_data_async(ticker)
+                except ValueError as e:
+                    if attempt == 2:
+                        return {"error": str(e)}
+                    logger.warning("Retrying %s after error: %s", ticker, e)
+                    await asyncio.sleep(delay)
+                    delay *= 2
+
+    results = await asyncio.gather(*(_fetch_one(ticker) for ticker in tickers))
+    return {ticker.upper(): result for ticker, result in zip(tickers, results)}
+
+
+def fetch_stock_data_batch(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch research payloads for several tickers in one pass.
+
+    Price histories come from a single yf.download call (one batched
+    request instead of one per ticker); the per-ticker info and news
+    lookups fan out across a thread pool. A failure for one ticker is
+    recorded as an {"error": ...} entry without failing the batch.
+
+    Args:
+        tickers: Ticker symbols to fetch (e.g., ["AAPL", "MSFT"])
+
+    Returns:
+        Mapping of upper-cased ticker to its fetch_stock_data() payload,
+        or {"error": message} for tickers that failed
+    """
+    tickers = [t.upper() for t in tickers]
+    session = Config.get_session()
+    fetched_at = datetime.now()
+
+    histories = yf.download(
+        " ".join(tickers),
+        period="3mo",
+        interval="1d",
+        group_by="ticker",
+        threads=True,
+        progress=False,
+        session=session,
+    )
+
+    def _fetch_one(ticker: str) -> Dict[str, Any]:
+        stock = yf.Ticker(ticker, session=session)
+        info = _cached_info(stock, ticker)
+        news_items = _fetch_news_safe(stock, ticker)
+        # With group_by="ticker", recent yfinance returns MultiIndex
+        # columns keyed by ticker even for a single symbol; older
+        # versions flatten one-ticker frames. Select by column shape
+        # rather than by ticker count.
+        if isinstance(histories.columns, pd.MultiIndex):
+            history = histories[ticker].dropna(how="all")
+        else:
+            history = histories
+        return _build_stock_payload(ticker, info, history, news_items, fetched_at)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as pool:
+        futures = {pool.submit(_fetch_one, ticker): ticker for ticker in tickers}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                logger.error("Error fetching data for %s: %s", ticker, e)
+                results[ticker] = {"error": f"Failed to fetch data for {ticker}: {str(e)}"}
+    return results
+
+
+# Render memo for the formatters. A payload is immutable once fetched and
+# (ticker, fetch_timestamp) identifies it exactly, so that pair is the
+# cache key - no need to serialize the whole dict just to look a render up.
+_render_cache: LRUCache = LRUCache(maxsize=64)
+
+
+def _payload_key(data: Dict[str, Any]):
+    """Cheap identity key for a fetch_stock_data payload, or None."""
+    ticker = data.get("ticker")
+    stamp = data.get("fetch_timestamp")
+    if ticker and stamp:
+        return (ticker, stamp)
+    return None
+
+
 def format_research_summary(data: Dict[str, Any]) -> str:
     """
     Format research data into human-readable summary for LLM consumption.
 
+    Renders are memoized per payload, so repeated calls for the same
+    research dict (researcher message, analyst prompt, re-prints) cost
+    one cache lookup after the first.
+
     Args:
         data: Output from fetch_stock_data()
 
     Returns:
         Formatted string summary suitable for LLM analysis
     """
-    company = data["company_info"]
-    price = data["price_data"]
-    fundamentals = data["fundamentals"]
-    historical = data["historical_data"]
-
-    # Helper functions to format values safely
-    def fmt_currency(val):
-        return f"${val:.2f}" if val else "N/A"
-
-    def fmt_pct(val):
-        return f"{val:.2f}%" if val else "N/A"
+    key = _payload_key(data)
+    if key is not None and key in _render_cache:
+        return _render_cache[key]
+    summary = _format_research_impl(data)
+    if key is not None:
+        _render_cache[key] = summary
+    return summary
 
-    def fmt_num(val):
-        return f"{val:,}" if val else "N/A"
 
-    def fmt_float(val):
-        return f"{val:.2f}" if val else "N/A"
+def _format_research_impl(data: Dict[str, Any]) -> str:
+    """Render the research summary."""
+    stock = StockData.from_dict(data)
+    company = stock.company_info
+    price = stock.price_data
+    fundamentals = stock.fundamentals
+    historical = stock.historical_data
 
     summary = f"""
-## Research Summary for {data['ticker']} - {company['name']}
+## Research Summary for {stock.ticker} - {company.name}
 
 ### Company Overview
-- Sector: {company['sector']}
-- Industry: {company['industry']}
-- Description: {company['description'][:200] if company['description'] else 'N/A'}...
+- Sector: {company.sector}
+- Industry: {company.industry}
+- Description: {company.description[:200] if company.description else 'N/A'}...
 
 ### Current Price Data
-- Current Price: {fmt_currency(price['current_price'])}
-- Day Range: {fmt_currency(price['day_low'])} - {fmt_currency(price['day_high'])}
-- 52-Week Range: {fmt_currency(price['52_week_low'])} - {fmt_currency(price['52_week_high'])}
-- Volume: {fmt_num(price['volume'])} (Avg: {fmt_num(price['avg_volume'])})
+- Current Price: {_fmt_currency(price.current_price)}
+- Day Range: {_fmt_currency(price.day_low)} - {_fmt_currency(price.day_high)}
+- 52-Week Range: {_fmt_currency(price.week52_low)} - {_fmt_currency(price.week52_high)}
+- Volume: {_fmt_num(price.volume)} (Avg: {_fmt_num(price.avg_volume)})
 
 ### Fundamental Metrics
-- Market Cap: {fmt_num(fundamentals['market_cap'])}
-- P/E Ratio: {fmt_float(fundamentals['pe_ratio'])}
-- Dividend Yield: {fmt_pct(fundamentals['dividend_yield']*100) if fundamentals['dividend_yield'] else 'N/A'}
-- Beta: {fmt_float(fundamentals['beta'])}
-- Profit Margin: {fmt_pct(fundamentals['profit_margin']*100) if fundamentals['profit_margin'] else 'N/A'}
+- Market Cap: {_fmt_num(fundamentals.market_cap)}
+- P/E Ratio: {_fmt_float(fundamentals.pe_ratio)}
+- Dividend Yield: {_fmt_pct_mult(fundamentals.dividend_yield)}
+- Beta: {_fmt_float(fundamentals.beta)}
+- Profit Margin: {_fmt_pct_mult(fundamentals.profit_margin)}
 
 ### Performance Trends
-- 90-Day Return: {fmt_pct(historical['90_day_return'])}
-- Volatility: {fmt_pct(historical['volatility'])}
+- 90-Day Return: {_fmt_pct(historical.return_90d)}
+- Volatility: {_fmt_pct(historical.volatility)}
 
 ### Recent News
 """
 
-    for i, article in enumerate(data['news'], 1):
-        summary += f"{i}. {article['title']} ({article['publisher']})\n"
+    # Accumulate news lines and join once rather than growing the string
+    parts = [summary]
+    for i, article in enumerate(stock.news, 1):
+        parts.append(f"{i}. {article['title']} ({article['publisher']})\n")
 
-    if not data['news']:
-        summary += "No recent news available.\n"
+    if not stock.news:
+        parts.append("No recent news available.\n")
 
-    return summary
+    return "".join(parts)
 
 
 def format_comparison_summary(data_a: Dict[str, Any], data_b: Dict[str, Any]) -> str:
     """
     Format comparison data into a side-by-side summary for LLM consumption.
 
+    Memoized per payload pair like format_research_summary.
+
     Args:
         data_a: Output from fetch_stock_data() for first stock
         data_b: Output from fetch_stock_data() for second stock
@@ -213,90 +673,65 @@ def format_comparison_summary(data_a: Dict[str, Any], data_b: Dict[str, Any]) ->
     Returns:
         Formatted string with side-by-side comparison suitable for LLM analysis
     """
-    # Helper functions to format values safely
-    def fmt_currency(val):
-        return f"${val:.2f}" if val else "N/A"
-
-    def fmt_pct(val):
-        return f"{val:.2f}%" if val else "N/A"
-
-    def fmt_num(val):
-        if val is None:
-            return "N/A"
-        if val >= 1_000_000_000_000:
-            return f"${val/1_000_000_000_000:.2f}T"
-        elif val >= 1_000_000_000:
-            return f"${val/1_000_000_000:.2f}B"
-        elif val >= 1_000_000:
-            return f"${val/1_000_000:.2f}M"
-        return f"{val:,}"
-
-    def fmt_float(val):
-        return f"{val:.2f}" if val else "N/A"
-
-    def fmt_pct_mult(val):
-        return f"{val*100:.2f}%" if val else "N/A"
-
-    ticker_a = data_a['ticker']
-    ticker_b = data_b['ticker']
-    company_a = data_a['company_info']
-    company_b = data_b['company_info']
-    price_a = data_a['price_data']
-    price_b = data_b['price_data']
-    fund_a = data_a['fundamentals']
-    fund_b = data_b['fundamentals']
-    hist_a = data_a['historical_data']
-    hist_b = data_b['historical_data']
-
-    summary = f"""
-## Stock Comparison: {ticker_a} vs {ticker_b}
-
-### Company Overview
-| Metric | {ticker_a} | {ticker_b} |
-|--------|------------|------------|
-| Name | {company_a['name']} | {company_b['name']} |
-| Sector | {company_a['sector']} | {company_b['sector']} |
-| Industry | {company_a['industry']} | {company_b['industry']} |
-
-### Price Data
-| Metric | {ticker_a} | {ticker_b} |
-|--------|------------|------------|
-| Current Price | {fmt_currency(price_a['current_price'])} | {fmt_currency(price_b['current_price'])} |
-| Day Range | {fmt_currency(price_a['day_low'])} - {fmt_currency(price_a['day_high'])} | {fmt_currency(price_b['day_low'])} - {fmt_currency(price_b['day_high'])} |
-| 52-Week Range | {fmt_currency(price_a['52_week_low'])} - {fmt_currency(price_a['52_week_high'])} | {fmt_currency(price_b['52_week_low'])} - {fmt_currency(price_b['52_week_high'])} |
-| Volume | {fmt_num(price_a['volume'])} | {fmt_num(price_b['volume'])} |
-| Avg Volume | {fmt_num(price_a['avg_volume'])} | {fmt_num(price_b['avg_volume'])} |
-
-### Fundamental Metrics
-| Metric | {ticker_a} | {ticker_b} |
-|--------|------------|------------|
-| Market Cap | {fmt_num(fund_a['market_cap'])} | {fmt_num(fund_b['market_cap'])} |
-| P/E Ratio | {fmt_float(fund_a['pe_ratio'])} | {fmt_float(fund_b['pe_ratio'])} |
-| Forward P/E | {fmt_float(fund_a['forward_pe'])} | {fmt_float(fund_b['forward_pe'])} |
-| PEG Ratio | {fmt_float(fund_a['peg_ratio'])} | {fmt_float(fund_b['peg_ratio'])} |
-| Dividend Yield | {fmt_pct_mult(fund_a['dividend_yield'])} | {fmt_pct_mult(fund_b['dividend_yield'])} |
-| Beta | {fmt_float(fund_a['beta'])} | {fmt_float(fund_b['beta'])} |
-| EPS | {fmt_currency(fund_a['eps'])} | {fmt_currency(fund_b['eps'])} |
-| Profit Margin | {fmt_pct_mult(fund_a['profit_margin'])} | {fmt_pct_mult(fund_b['profit_margin'])} |
-| Revenue Growth | {fmt_pct_mult(fund_a['revenue_growth'])} | {fmt_pct_mult(fund_b['revenue_growth'])} |
-
-### Performance Trends
-| Metric | {ticker_a} | {ticker_b} |
-|--------|------------|------------|
-| 90-Day Return | {fmt_pct(hist_a['90_day_return'])} | {fmt_pct(hist_b['90_day_return'])} |
-| Volatility | {fmt_pct(hist_a['volatility'])} | {fmt_pct(hist_b['volatility'])} |
+    key_a = _payload_key(data_a)
+    key_b = _payload_key(data_b)
+    key = ("cmp", key_a, key_b) if key_a and key_b else None
+    if key is not None and key in _render_cache:
+        return _render_cache[key]
+    summary = _format_comparison_impl(data_a, data_b)
+    if key is not None:
+        _render_cache[key] = summary
+    return summary
 
-### Recent News - {ticker_a}
-"""
-    for i, article in enumerate(data_a['news'], 1):
-        summary += f"{i}. {article['title']} ({article['publisher']})\n"
-    if not data_a['news']:
-        summary += "No recent news available.\n"
 
-    summary += f"\n### Recent News - {ticker_b}\n"
-    for i, article in enumerate(data_b['news'], 1):
-        summary += f"{i}. {article['title']} ({article['publisher']})\n"
-    if not data_b['news']:
-        summary += "No recent news available.\n"
+def _format_comparison_impl(data_a: Dict[str, Any], data_b: Dict[str, Any]) -> str:
+    """Render the comparison summary."""
+    stock_a = StockData.from_dict(data_a)
+    stock_b = StockData.from_dict(data_b)
+
+    def _side(suffix, stock):
+        """Build the template mapping entries for one side of the table."""
+        company = stock.company_info
+        price = stock.price_data
+        fund = stock.fundamentals
+        hist = stock.historical_data
+        return {
+            f"ticker_{suffix}": stock.ticker,
+            f"name_{suffix}": company.name,
+            f"sector_{suffix}": company.sector,
+            f"industry_{suffix}": company.industry,
+            f"price_{suffix}": _fmt_currency(price.current_price),
+            f"day_range_{suffix}": f"{_fmt_currency(price.day_low)} - {_fmt_currency(price.day_high)}",
+            f"week52_range_{suffix}": f"{_fmt_currency(price.week52_low)} - {_fmt_currency(price.week52_high)}",
+            f"volume_{suffix}": _fmt_num_abbrev(price.volume),
+            f"avg_volume_{suffix}": _fmt_num_abbrev(price.avg_volume),
+            f"market_cap_{suffix}": _fmt_num_abbrev(fund.market_cap),
+            f"pe_ratio_{suffix}": _fmt_float(fund.pe_ratio),
+            f"forward_pe_{suffix}": _fmt_float(fund.forward_pe),
+            f"peg_ratio_{suffix}": _fmt_float(fund.peg_ratio),
+            f"dividend_yield_{suffix}": _fmt_pct_mult(fund.dividend_yield),
+            f"beta_{suffix}": _fmt_float(fund.beta),
+            f"eps_{suffix}": _fmt_currency(fund.eps),
+            f"profit_margin_{suffix}": _fmt_pct_mult(fund.profit_margin),
+            f"revenue_growth_{suffix}": _fmt_pct_mult(fund.revenue_growth),
+            f"return_90d_{suffix}": _fmt_pct(hist.return_90d),
+            f"volatility_{suffix}": _fmt_pct(hist.volatility),
+        }
 
-    return summary
+    mapping = _side("a", stock_a)
+    mapping.update(_side("b", stock_b))
+    summary = _COMPARISON_TMPL.format_map(mapping)
+    # Accumulate news lines and join once rather than growing the string
+    parts = [summary]
+    for i, article in enumerate(stock_a.news, 1):
+        parts.append(f"{i}. {article['title']} ({article['publisher']})\n")
+    if not stock_a.news:
+        parts.append("No recent news available.\n")
+
+    parts.append(f"\n### Recent News - {stock_b.ticker}\n")
+    for i, article in enumerate(stock_b.news, 1):
+        parts.append(f"{i}. {article['title']} ({article['publisher']})\n")
+    if not stock_b.news:
+        parts.append("No recent news available.\n")
+
+    return "".join(parts)